@@ -12,6 +12,9 @@
 #  * See the License for the specific language governing permissions and
 #  * limitations under the License.
 
+import logging
+import os
+import re
 import shutil
 import sys
 
@@ -28,10 +31,20 @@ from functools import lru_cache
 from typing import List, Optional
 from zipfile import ZipFile
 
+import libarchive
+from libarchive.exception import ArchiveError as LibArchiveError
+from libarchive.extract import (
+    EXTRACT_SECURE_NODOTDOT, EXTRACT_SECURE_SYMLINKS,
+    extract_entries
+)
+
 from pims.api.exceptions import NoMatchingFormatProblem
 from pims.files.file import Path
 
 
+log = logging.getLogger("pims.app")
+
+
 class ArchiveError(OSError):
     pass
 
@@ -148,16 +161,73 @@ class Archive(Path):
                 f"it already exists or it is not a directory"
             )
 
+        # Entries are extracted by libarchive, in C, with paths rewritten
+        # to be in `path`. As `path` is resolved, it has no symlink nor `..`
+        # component. Entries that could give access to files outside of it
+        # are not extracted: absolute paths, paths with `..` components
+        # (libarchive would abort the whole extraction on them, it is only
+        # kept as a safeguard), symbolic links (which would be
+        # followed when importing extracted files) and hard links to files
+        # outside the archive.
+        path.mkdir(parents=True, exist_ok=True)
+        root = path.resolve()
+
+        def _entries(archive):
+            for entry in archive:
+                pathname = entry.pathname
+                if not pathname:
+                    continue
+                if os.path.isabs(pathname):
+                    log.warning(
+                        f"{self}: entry {pathname} has an absolute path, "
+                        f"it is not extracted."
+                    )
+                    continue
+                if '..' in re.split(r'[/\\]', pathname):
+                    log.warning(
+                        f"{self}: entry {pathname} has a '..' component, "
+                        f"it is not extracted."
+                    )
+                    continue
+                if entry.issym:
+                    log.warning(
+                        f"{self}: entry {pathname} is a symbolic link, "
+                        f"it is not extracted."
+                    )
+                    continue
+                if entry.islnk:
+                    # Hard links targets are archive paths too.
+                    linkpath = os.path.normpath(
+                        os.path.join(root, entry.linkpath)
+                    )
+                    if os.path.commonpath([root, linkpath]) != str(root):
+                        log.warning(
+                            f"{self}: entry {pathname} is a hard link to "
+                            f"{entry.linkpath}, out of the archive, "
+                            f"it is not extracted."
+                        )
+                        continue
+                    entry.linkpath = linkpath
+                entry.pathname = os.path.join(root, pathname)
+                yield entry
+
         try:
-            shutil.unpack_archive(self.absolute(), path, self._format.name)
-        except shutil.ReadError as e:
+            with libarchive.file_reader(str(self.absolute())) as archive:
+                extract_entries(
+                    _entries(archive),
+                    EXTRACT_SECURE_NODOTDOT | EXTRACT_SECURE_SYMLINKS
+                )
+        except LibArchiveError as e:
             raise ArchiveError(str(e))
 
         if clean:
             bad_filenames = ['.DS_STORE', '__MACOSX']
             for bad_filename in bad_filenames:
-                for bad_path in path.rglob(bad_filename):
-                    bad_path.unlink(missing_ok=True)
+                for bad_path in list(path.rglob(bad_filename)):
+                    if bad_path.is_dir() and not bad_path.is_symlink():
+                        shutil.rmtree(bad_path, ignore_errors=True)
+                    else:
+                        bad_path.unlink(missing_ok=True)
 
     @classmethod
     def from_path(cls, path):
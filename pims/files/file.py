@@ -16,6 +16,7 @@ from __future__ import annotations
 import shutil
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path as _Path
 from typing import Callable, List, TYPE_CHECKING, Union
 
@@ -44,6 +45,16 @@ HISTOGRAM_STEM = "histogram"
 _NUM_SIGNATURE_BYTES = 262
 
 
+@lru_cache(maxsize=1024)
+def _read_signature(path: str, size: int, mtime_ns: int) -> bytes:
+    """
+    Read file signature. File size and modification time are part of the
+    cache key so that a modified file is read again.
+    """
+    with open(path, 'rb') as fp:
+        return fp.read(_NUM_SIGNATURE_BYTES)
+
+
 class FileRole(str, Enum):
     """
     The role of a file. The same image data can be represented in different ways, in different
@@ -364,8 +375,11 @@ class Path(PlatformPath, _Path, SafelyCopiable):
         """
         if not self.is_file():
             return bytearray()
-        with self.resolve().open('rb') as fp:
-            return bytearray(fp.read(_NUM_SIGNATURE_BYTES))
+        resolved = self.resolve()
+        stat = resolved.stat()
+        return bytearray(
+            _read_signature(str(resolved), stat.st_size, stat.st_mtime_ns)
+        )
 
     @property
     def path(self) -> Path:
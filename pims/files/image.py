@@ -56,10 +56,20 @@ class Image(Path):
             raise NoMatchingFormatProblem(self)
         else:
             if _format.path.absolute() != self.absolute():
-                # Paths mismatch: reload format
-                _format = _format.from_path(self)
+                # Paths mismatch: reload format, unless both paths are the
+                # same file (e.g. a symlink) whose header is already parsed.
+                if self._is_same_file(_format.path):
+                    _format = _format.with_path(self)
+                else:
+                    _format = _format.from_path(self)
             self._format = _format
 
+    def _is_same_file(self, other: Path) -> bool:
+        try:
+            return self.samefile(other)
+        except OSError:
+            return False
+
     @property
     def format(self) -> AbstractFormat:
         return self._format
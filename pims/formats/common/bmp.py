@@ -12,15 +12,18 @@
 #  * See the License for the specific language governing permissions and
 #  * limitations under the License.
 import logging
-from typing import Optional
+import struct
+from typing import Optional, Tuple
 
+import numpy as np
+from PIL import Image as PILImage
 from pint import Quantity
 
 from pims.cache import cached_property
 from pims.formats import AbstractFormat
-from pims.formats.utils.checker import SignatureChecker
+from pims.formats.utils.checker import MagicNumberChecker
 from pims.formats.utils.engines.pil import (
-    PillowParser, PillowSpatialConvertor, SimplePillowReader
+    PillowParser, PillowSpatialConvertor, SimplePillowReader, is_pillow_simd
 )
 from pims.formats.utils.histogram import DefaultHistogramReader
 from pims.formats.utils.structures.metadata import ImageMetadata
@@ -29,29 +32,29 @@ from pims.utils.types import parse_float
 
 log = logging.getLogger("pims.formats")
 
+# Tags reference: https://exiftool.org/TagNames/BMP.html
+_BMP_TAGS = ("File.Comment", "File.PixelsPerMeterX", "File.PixelsPerMeterY")
 
-class BMPChecker(SignatureChecker):
+# Parsing a unit with the registry is costly, do it once.
+_METER = UNIT_REGISTRY("meters")
 
-    @classmethod
-    def match(cls, pathlike):
-        buf = cls.get_signature(pathlike)
-        return (len(buf) > 1 and
-                buf[0] == 0x42 and
-                buf[1] == 0x4D)
+
+class BMPChecker(MagicNumberChecker):
+    MAGIC_NUMBERS = ((0, b"BM"),)
 
 
 class BMPParser(PillowParser):
     FORMAT_SLUG = 'BMP'
 
     def parse_known_metadata(self) -> ImageMetadata:
-        # Tags reference: https://exiftool.org/TagNames/BMP.html
         imd = super().parse_known_metadata()
         raw = self.format.raw_metadata
 
-        imd.description = raw.get_value("File.Comment")
+        description, ppm_x, ppm_y = raw.get_values(_BMP_TAGS)
+        imd.description = description
         imd.acquisition_datetime = self.format.path.creation_datetime
-        imd.physical_size_x = self.parse_physical_size(raw.get_value("File.PixelsPerMeterX"))
-        imd.physical_size_y = self.parse_physical_size(raw.get_value("File.PixelsPerMeterY"))
+        imd.physical_size_x = self.parse_physical_size(ppm_x)
+        imd.physical_size_y = self.parse_physical_size(ppm_y)
         imd.is_complete = True
         return imd
 
@@ -60,13 +63,65 @@ class BMPParser(PillowParser):
         if physical_size is not None:
             physical_size = parse_float(physical_size)
             if physical_size is not None and physical_size > 0:
-                return 1 / physical_size * UNIT_REGISTRY("meters")
+                return 1 / physical_size * _METER
+        return None
+
+
+def _map_uncompressed_rgb(path) -> Optional[np.ndarray]:
+    """
+    Memory-map pixels of an uncompressed (BI_RGB) 24 or 32-bit BMP, as a
+    (height, width, bytes per pixel) array view in BGR(X) order, top row
+    first. Nothing is read from disk until the view is sliced and copied.
+
+    Returns None for any other kind of BMP (palette, RLE, bitfields, ...).
+    """
+    # https://en.wikipedia.org/wiki/BMP_file_format#Bitmap_file_header
+    buf = path.signature()
+    if len(buf) < 34:
         return None
+    data_offset = struct.unpack_from("<I", buf, 10)[0]
+    dib_header_size, width, height, _, bpp, compression = struct.unpack_from(
+        "<IiiHHI", buf, 14
+    )
+    if dib_header_size < 40 or compression != 0 or bpp not in (24, 32) \
+            or width <= 0 or height == 0:
+        return None
+
+    n_rows = abs(height)
+    stride = ((width * bpp + 31) // 32) * 4
+    try:
+        rows = np.memmap(
+            str(path), dtype=np.uint8, mode='r', offset=data_offset,
+            shape=(n_rows, stride)
+        )
+    except (OSError, ValueError):
+        # Truncated file
+        return None
+
+    pixel_size = bpp // 8
+    pixels = rows[:, :width * pixel_size].reshape((n_rows, width, pixel_size))
+    if height > 0:
+        # Bottom-up bitmap
+        pixels = pixels[::-1]
+    return pixels
 
 
 class BMPReader(SimplePillowReader):
     FORMAT_SLUG = 'BMP'
 
+    def read_window(self, region, out_width, out_height, c=None, z=None, t=None):
+        pixels = self.format.get_cached(
+            '_bmp_rgb_memmap', _map_uncompressed_rgb, self.format.path
+        )
+        if pixels is None:
+            return super().read_window(region, out_width, out_height, c, z, t)
+
+        region = region.scale_to_tier(self.format.pyramid.base)
+        # BGR(X) to RGB, returned as a Pillow image like other BMP windows.
+        return PILImage.fromarray(np.ascontiguousarray(
+            pixels[region.top:region.bottom, region.left:region.right, 2::-1]
+        ))
+
 
 class BMPFormat(AbstractFormat):
     """BMP Format.
@@ -88,6 +143,15 @@ class BMPFormat(AbstractFormat):
         from PIL import BmpImagePlugin
         assert BmpImagePlugin
 
+        import PIL
+        if is_pillow_simd():
+            log.info(f"BMP: using Pillow-SIMD {PIL.__version__}")
+        else:
+            log.info(
+                f"BMP: using Pillow {PIL.__version__} "
+                f"(Pillow-SIMD not installed, no SIMD resize/convert)"
+            )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._enabled = True
@@ -96,10 +160,24 @@ class BMPFormat(AbstractFormat):
     def is_spatial(cls):
         return True
 
+    def _peek_dimensions(self) -> Tuple[int, int]:
+        # https://en.wikipedia.org/wiki/BMP_file_format#DIB_header_(bitmap_information_header)
+        buf = self.path.signature()
+        if len(buf) >= 26:
+            dib_header_size = struct.unpack_from("<I", buf, 14)[0]
+            if dib_header_size == 12:
+                # OS/2 BITMAPCOREHEADER
+                return struct.unpack_from("<HH", buf, 18)
+            if dib_header_size >= 40:
+                width, height = struct.unpack_from("<ii", buf, 18)
+                # Negative height means a top-down bitmap
+                return width, abs(height)
+        return super()._peek_dimensions()
+
     @cached_property
     def need_conversion(self):
-        imd = self.main_imd
-        return imd.width > 1400 or imd.height > 1400
+        width, height = self._peek_dimensions()
+        return width > 1400 or height > 1400
 
     @property
     def media_type(self):
@@ -18,8 +18,7 @@ from pint import Quantity
 
 from pims.cache import cached_property
 from pims.formats import AbstractFormat
-from pims.formats.utils.abstract import CachedDataPath
-from pims.formats.utils.checker import SignatureChecker
+from pims.formats.utils.checker import MagicNumberChecker
 from pims.formats.utils.engines.vips import (
     VipsParser, VipsReader,
     VipsSpatialConvertor
@@ -32,14 +31,8 @@ from pims.utils.types import parse_datetime, parse_float
 log = logging.getLogger("pims.formats")
 
 
-class JPEGChecker(SignatureChecker):
-    @classmethod
-    def match(cls, pathlike: CachedDataPath) -> bool:
-        buf = cls.get_signature(pathlike)
-        return (len(buf) > 2 and
-                buf[0] == 0xFF and
-                buf[1] == 0xD8 and
-                buf[2] == 0xFF)
+class JPEGChecker(MagicNumberChecker):
+    MAGIC_NUMBERS = ((0, b"\xFF\xD8\xFF"),)
 
 
 class JPEGParser(VipsParser):
@@ -12,14 +12,14 @@
 #  * See the License for the specific language governing permissions and
 #  * limitations under the License.
 import logging
-from typing import Optional
+import struct
+from typing import Optional, Tuple
 
 from pint import Quantity
 
 from pims.cache import cached_property
 from pims.formats import AbstractFormat
-from pims.formats.utils.abstract import CachedDataPath
-from pims.formats.utils.checker import SignatureChecker
+from pims.formats.utils.checker import MagicNumberChecker
 from pims.formats.utils.engines.vips import (
     VipsParser, VipsReader,
     VipsSpatialConvertor
@@ -31,16 +31,26 @@ from pims.utils.types import parse_datetime, parse_float
 
 log = logging.getLogger("pims.formats")
 
+# Tags reference: https://exiftool.org/TagNames/PNG.html
+_PNG_DESC_TAGS = ("PNG.Comment", "EXIF.ImageDescription", "EXIF.UserComment")
+_PNG_DATE_TAGS = (
+    "PNG.CreationTime", "PNG.ModifyDate", "EXIF.CreationDate",
+    "EXIF.DateTimeOriginal", "EXIF.ModifyDate"
+)
+_PNG_PHYS_TAGS = ("PNG.PixelsPerUnitX", "PNG.PixelsPerUnitY", "PNG.PixelUnits")
+_EXIF_RES_TAGS = ("EXIF.XResolution", "EXIF.YResolution", "EXIF.ResolutionUnit")
+
+# Parsing a unit with the registry is costly, do it once.
+# Units are given as integers in EXIF and as strings in PNG.
+_METER = UNIT_REGISTRY("meter")
+_INCH = UNIT_REGISTRY("inch")
+_EXIF_UNITS = {1: _METER, 2: _INCH}
+_PNG_UNITS = {"meters": _METER, "inches": _INCH}
 
-class PNGChecker(SignatureChecker):
-    @classmethod
-    def match(cls, pathlike: CachedDataPath) -> bool:
-        buf = cls.get_signature(pathlike)
-        return (len(buf) > 3 and
-                buf[0] == 0x89 and
-                buf[1] == 0x50 and
-                buf[2] == 0x4E and
-                buf[3] == 0x47)
+
+class PNGChecker(MagicNumberChecker):
+    # http://www.libpng.org/pub/png/spec/1.2/PNG-Structure.html#PNG-file-signature
+    MAGIC_NUMBERS = ((0, b"\x89PNG\r\n\x1a\n"),)
 
 
 class PNGParser(VipsParser):
@@ -57,30 +67,16 @@ class PNGParser(VipsParser):
         imd = super().parse_known_metadata()
         raw = self.format.raw_metadata
 
-        desc_fields = ("PNG.Comment", "EXIF.ImageDescription", "EXIF.UserComment")
-        imd.description = raw.get_first_value(desc_fields)
-
-        date_fields = ("PNG.CreationTime", "PNG.ModifyDate", "EXIF.CreationDate",
-                       "EXIF.DateTimeOriginal", "EXIF.ModifyDate")
-        imd.acquisition_datetime = parse_datetime(raw.get_first_value(date_fields))
-
-        imd.physical_size_x = self.parse_physical_size(
-            raw.get_value("PNG.PixelsPerUnitX"),
-            raw.get_value("PNG.PixelUnits"), True
-        )
-        imd.physical_size_y = self.parse_physical_size(
-            raw.get_value("PNG.PixelsPerUnitY"),
-            raw.get_value("PNG.PixelUnits"), True
-        )
+        imd.description = raw.get_first_value(_PNG_DESC_TAGS)
+        imd.acquisition_datetime = parse_datetime(raw.get_first_value(_PNG_DATE_TAGS))
+
+        ppu_x, ppu_y, unit = raw.get_values(_PNG_PHYS_TAGS)
+        imd.physical_size_x = self.parse_physical_size(ppu_x, unit, True)
+        imd.physical_size_y = self.parse_physical_size(ppu_y, unit, True)
         if imd.physical_size_x is None and imd.physical_size_y is None:
-            imd.physical_size_x = self.parse_physical_size(
-                raw.get_value("EXIF.XResolution"),
-                raw.get_value("EXIF.ResolutionUnit"), False
-            )
-            imd.physical_size_y = self.parse_physical_size(
-                raw.get_value("EXIF.YResolution"),
-                raw.get_value("EXIF.ResolutionUnit"), False
-            )
+            res_x, res_y, unit = raw.get_values(_EXIF_RES_TAGS)
+            imd.physical_size_x = self.parse_physical_size(res_x, unit, False)
+            imd.physical_size_y = self.parse_physical_size(res_y, unit, False)
         imd.is_complete = True
         return imd
 
@@ -88,16 +84,14 @@ class PNGParser(VipsParser):
     def parse_physical_size(
         physical_size: Optional[str], unit: Optional[str], inverse: bool
     ) -> Optional[Quantity]:
-        supported_units = {1: "meter", 2: "inch"}
-        if type(unit) == str:
-            supported_units = {"meters": "meter", "inches": "inch"}
-        if physical_size is not None and unit in supported_units.keys():
+        supported_units = _PNG_UNITS if type(unit) == str else _EXIF_UNITS
+        if physical_size is not None and unit in supported_units:
             physical_size = parse_float(physical_size)
             if physical_size is None or physical_size <= 0:
                 return None
             if inverse:
                 physical_size = 1 / physical_size
-            return physical_size * UNIT_REGISTRY(supported_units[unit])
+            return physical_size * supported_units[unit]
         return None
 
 
@@ -126,10 +120,18 @@ class PNGFormat(AbstractFormat):
     def is_spatial(cls):
         return True
 
+    def _peek_dimensions(self) -> Tuple[int, int]:
+        # IHDR is always the first chunk, right after the 8-byte signature.
+        # http://www.libpng.org/pub/png/spec/1.2/PNG-Chunks.html#C.IHDR
+        buf = self.path.signature()
+        if len(buf) >= 24 and buf[12:16] == b"IHDR":
+            return struct.unpack_from(">II", buf, 16)
+        return super()._peek_dimensions()
+
     @cached_property
     def need_conversion(self):
-        imd = self.main_imd
-        return imd.width > 1024 or imd.height > 1024
+        width, height = self._peek_dimensions()
+        return width > 1024 or height > 1024
 
     @property
     def media_type(self):
@@ -18,8 +18,7 @@ from pint import Quantity
 
 from pims.cache import cached_property
 from pims.formats import AbstractFormat
-from pims.formats.utils.abstract import CachedDataPath
-from pims.formats.utils.checker import SignatureChecker
+from pims.formats.utils.checker import MagicNumberChecker
 from pims.formats.utils.engines.vips import (
     VipsParser, VipsReader,
     VipsSpatialConvertor
@@ -32,21 +31,9 @@ from pims.utils.types import parse_datetime, parse_float
 log = logging.getLogger("pims.formats")
 
 
-class WebPChecker(SignatureChecker):
-    @classmethod
-    def match(cls, pathlike: CachedDataPath) -> bool:
-        buf = cls.get_signature(pathlike)
-        return (len(buf) > 13 and
-                buf[0] == 0x52 and
-                buf[1] == 0x49 and
-                buf[2] == 0x46 and
-                buf[3] == 0x46 and
-                buf[8] == 0x57 and
-                buf[9] == 0x45 and
-                buf[10] == 0x42 and
-                buf[11] == 0x50 and
-                buf[12] == 0x56 and
-                buf[13] == 0x50)
+class WebPChecker(MagicNumberChecker):
+    # RIFF container holding a WebP (lossy, lossless or extended) image
+    MAGIC_NUMBERS = ((0, b"RIFF"), (8, b"WEBPVP"))
 
 
 class WebPParser(VipsParser):
@@ -16,9 +16,9 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Type
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple, Type
 
-from pims.cache import SimpleDataCache, cached_property
+from pims.cache import SimpleDataCache, cached_property, safe_cached_property
 from pims.formats.utils.checker import AbstractChecker
 from pims.formats.utils.convertor import AbstractConvertor
 from pims.formats.utils.histogram import AbstractHistogramReader
@@ -195,6 +195,22 @@ class AbstractFormat(ABC, SimpleDataCache):
     def from_path(cls, path: Path) -> AbstractFormat:
         return cls(path=path)
 
+    def with_path(self, path: Path) -> AbstractFormat:
+        """
+        Get this format for another path to the same file (e.g. a symlink),
+        keeping what has already been parsed or cached for this file.
+        """
+        format = self.__class__(path=path)
+        format._enabled = self._enabled
+        format._cache.update(self._cache)
+
+        cls = type(self)
+        for name, value in vars(self).items():
+            prop = getattr(cls, name, None)
+            if isinstance(prop, (cached_property, safe_cached_property)):
+                setattr(format, name, value)
+        return format
+
     @property
     def enabled(self):
         return self._enabled
@@ -213,6 +229,13 @@ class AbstractFormat(ABC, SimpleDataCache):
 
     # Conversion
 
+    def _peek_dimensions(self) -> Tuple[int, int]:
+        """
+        Get image (width, height). Formats can override it to read them
+        directly from file header, without a full metadata parsing.
+        """
+        return self.main_imd.width, self.main_imd.height
+
     @cached_property
     def need_conversion(self) -> bool:
         """
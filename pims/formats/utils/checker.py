@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     from pims.formats.utils.abstract import CachedDataPath
@@ -40,3 +40,37 @@ class SignatureChecker(AbstractChecker, ABC):
     def get_signature(cls, pathlike: CachedDataPath) -> bytearray:
         """Get cached file signature"""
         return pathlike.get_cached('signature', pathlike.path.signature)
+
+
+class MagicNumberChecker(SignatureChecker):
+    """
+    Signature checker for formats identified by magic numbers at fixed
+    offsets. The format matches if the signature contains every magic number
+    of `MAGIC_NUMBERS` at its offset, each checked with a single bytes
+    comparison.
+    """
+    MAGIC_NUMBERS: Tuple[Tuple[int, bytes], ...] = ()
+
+    # (slice, magic number) pairs, computed once from `MAGIC_NUMBERS`.
+    _magic_slices: Tuple[Tuple[slice, bytes], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._magic_slices = tuple(
+            (slice(offset, offset + len(magic)), magic)
+            for offset, magic in cls.MAGIC_NUMBERS
+        )
+
+    @classmethod
+    def match(cls, pathlike: CachedDataPath) -> bool:
+        buf = cls.get_signature(pathlike)
+        magic_slices = cls._magic_slices
+        if len(magic_slices) == 1:
+            # Most formats have a single magic number.
+            magic_slice, magic = magic_slices[0]
+            return buf[magic_slice] == magic
+
+        for magic_slice, magic in magic_slices:
+            if buf[magic_slice] != magic:
+                return False
+        return len(magic_slices) > 0
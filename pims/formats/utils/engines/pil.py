@@ -14,6 +14,7 @@
 import logging
 from typing import Optional
 
+import PIL
 import numpy as np
 from PIL import Image as PILImage
 
@@ -30,6 +31,14 @@ from pims.processing.region import Region
 log = logging.getLogger("pims.formats")
 
 
+def is_pillow_simd() -> bool:
+    """
+    Whether the installed PIL is Pillow-SIMD. Pillow-SIMD releases are
+    published as post-releases of the Pillow version they are based on.
+    """
+    return ".post" in PIL.__version__
+
+
 def cached_pillow_file(
     format: AbstractFormat, pil_format_slug: Optional[str]
 ) -> PILImage:
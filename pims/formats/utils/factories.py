@@ -13,14 +13,22 @@
 #  * limitations under the License.
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from threading import Lock
+from typing import Hashable, Optional, TYPE_CHECKING
 
+from pims.cache.memory import LRUCache
 from pims.formats import FORMATS, FormatsByExt
 from pims.formats.utils.abstract import AbstractFormat, CachedDataPath
 
 if TYPE_CHECKING:
     from pims.files.file import Path
 
+# Last matched format class for a given (path, size, mtime, factory formats).
+# It is only a hint: the format checker is always run again on a hit.
+# The LRU cache is not thread-safe, while formats are matched concurrently.
+_MATCH_CACHE = LRUCache(1024)
+_MATCH_CACHE_LOCK = Lock()
+
 
 class FormatFactory:
     def __init__(self, match_on_ext: bool = False, formats: FormatsByExt = None):
@@ -41,6 +49,14 @@ class FormatFactory:
             formats = FORMATS
         self.formats = formats
         self.match_on_ext = match_on_ext
+        self._formats_key = tuple(formats.keys())
+
+    def _match_cache_key(self, path: Path) -> Optional[Hashable]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return str(path), stat.st_size, stat.st_mtime_ns, self._formats_key
 
     def match(self, path: Path) -> Optional[AbstractFormat]:
         """
@@ -65,8 +81,18 @@ class FormatFactory:
             if format is not None:
                 return format(path)
         proxy = CachedDataPath(path)
+        cache_key = self._match_cache_key(path)
+        if cache_key is not None:
+            with _MATCH_CACHE_LOCK:
+                format = _MATCH_CACHE.get(cache_key)
+            if format is not None and format.match(proxy):
+                return format.from_proxy(proxy)
+
         for format in self.formats.values():
             if format.match(proxy):
+                if cache_key is not None:
+                    with _MATCH_CACHE_LOCK:
+                        _MATCH_CACHE.put(cache_key, format)
                 return format.from_proxy(proxy)
 
         return None
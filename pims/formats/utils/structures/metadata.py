@@ -168,6 +168,12 @@ class MetadataStore:
             return metadata.value
         return default
 
+    def get_values(
+        self, namespaced_keys: Sequence[str], default: Any = None
+    ) -> Tuple[Any, ...]:
+        """Get metadata values for a sequence of (namespaced) keys, in order"""
+        return tuple(self.get_value(key, default) for key in namespaced_keys)
+
     def get_first_value(self, namespaced_keys: Sequence[str], default: Any = None) -> Any:
         """Get the first non-null metadata value in the list of metadata keys"""
         for namespaced_key in namespaced_keys:
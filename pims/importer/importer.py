@@ -11,12 +11,18 @@
 #  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  * See the License for the specific language governing permissions and
 #  * limitations under the License.
+import errno
 import logging
+import multiprocessing
+import os
 import shutil
-from typing import List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from celery import group, signature
 from celery.result import allow_join_result  # noqa
+from cytomine import Cytomine
 
 from pims.api.exceptions import (
     BadRequestException, FilepathNotFoundProblem,
@@ -62,6 +68,39 @@ class FormatConversionProblem(BadRequestException):
     pass
 
 
+class BatchImportError(BadRequestException):
+    """
+    An import error raised in a batch import worker process. Only the type
+    name and detail of the original error are sent to the parent process,
+    as the original error can hold unpicklable objects (such as an image).
+    """
+    def __init__(self, error_type: str, detail: str):
+        super().__init__(error_type, detail)
+
+    def __str__(self):
+        return f"{self.title}: {self.detail}"
+
+
+def prefetch_file(path: Path):
+    """
+    Ask the kernel to start reading a file into page cache, in background.
+    Subsequent reads (format detection, integrity check) then hit memory.
+    It is only a hint: nothing is done if not supported.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 class FileImporter:
     """
     Image importer from file. It moves a pending file to PIMS root path, tries to
@@ -70,6 +109,9 @@ class FileImporter:
 
     listeners: List[ImportListener]
 
+    # For each listener, its handler for each import event type
+    _dispatch: List[Dict[ImportEventType, Callable]]
+
     # Pending file (not yet in `FILE_ROOT_PATH`)
     pending_file: Path
     pending_name: Optional[str]
@@ -94,6 +136,11 @@ class FileImporter:
     histogram_path: Optional[Path]
     histogram: Optional[Histogram]
 
+    # Histogram being built in background, as soon as the spatial
+    # representation exists.
+    _histogram_future: Optional[Future]
+    _executor: Optional[ThreadPoolExecutor]
+
     def __init__(
         self, pending_file: Path, pending_name: Optional[str] = None,
         listeners: Optional[List[ImportListener]] = None
@@ -110,6 +157,9 @@ class FileImporter:
             A list of import listeners
         """
         self.listeners = listeners if listeners is not None else []
+        self._dispatch = [
+            self._listener_handlers(listener) for listener in self.listeners
+        ]
         self.pending_file = pending_file
         self.pending_name = pending_name
 
@@ -125,13 +175,30 @@ class FileImporter:
         self.processed_dir = None
         self.extracted_dir = None
 
+        self._histogram_future = None
+        self._executor = None
+
+    @staticmethod
+    def _listener_handlers(
+        listener: ImportListener
+    ) -> Dict[ImportEventType, Callable]:
+        handlers = dict()
+        for event in ImportEventType:
+            handler = getattr(listener, event.value, None)
+            if callable(handler):
+                handlers[event] = handler
+        return handlers
+
     def notify(self, method: ImportEventType, *args, **kwargs):
-        for listener in self.listeners:
+        for listener, handlers in zip(self.listeners, self._dispatch):
+            handler = handlers.get(method)
+            if handler is None:
+                log.warning(f"No method {method} for import listener {listener}")
+                continue
             try:
-                getattr(listener, method)(*args, **kwargs)
+                handler(*args, **kwargs)
             except AttributeError as e:
                 log.error(e)
-                log.warning(f"No method {method} for import listener {listener}")
 
     def run(self, prefer_copy: bool = False):
         """
@@ -148,6 +215,7 @@ class FileImporter:
         FilepathNotFoundProblem
             If pending file is not found.
         """
+        self._executor = ThreadPoolExecutor(max_workers=1)
         try:
             self.notify(ImportEventType.START_DATA_EXTRACTION, self.pending_file)
 
@@ -174,6 +242,7 @@ class FileImporter:
             self.upload_path = self.upload_dir / name
 
             self.move(self.pending_file, self.upload_path, prefer_copy)
+            prefetch_file(self.upload_path)
 
             # If the pending file comes from an archive
             if not prefer_copy and self.pending_file.is_extracted():
@@ -263,6 +332,9 @@ class FileImporter:
             # Check original image integrity
             self.notify(ImportEventType.START_INTEGRITY_CHECK, self.original_path)
             self.original = Image(self.original_path, format=format)
+            # Continue with the image format, such that metadata parsed during
+            # integrity check are not parsed again for next steps.
+            format = self.original.format
             errors = self.original.check_integrity(check_metadata=True)
             if len(errors) > 0:
                 self.notify(
@@ -286,11 +358,15 @@ class FileImporter:
             )
             return [self.upload_path]
         except Exception as e:
+            self.discard_histogram_build()
             self.notify(
                 ImportEventType.FILE_ERROR,
                 self.upload_path, exeception=e
             )
             raise e
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def deploy_spatial(self, format: AbstractFormat) -> Image:
         """
@@ -348,6 +424,7 @@ class FileImporter:
                 )
                 raise ImageParsingProblem(self.spatial)
             self.notify(ImportEventType.END_INTEGRITY_CHECK, self.spatial)
+            self.start_histogram_build()
 
         else:
             # Create spatial role
@@ -355,15 +432,54 @@ class FileImporter:
             self.spatial_path = self.processed_dir / spatial_filename
             self.mksymlink(self.spatial_path, self.original_path)
             self.spatial = Image(self.spatial_path, format=format)
+            self.start_histogram_build()
 
         assert self.spatial.has_spatial_role()
         self.notify(ImportEventType.END_SPATIAL_DEPLOY, self.spatial)
         return self.spatial
 
+    def start_histogram_build(self):
+        """
+        Start building the histogram in background, from the spatial
+        representation, so that it overlaps with remaining import steps.
+        The result is collected by `deploy_histogram`.
+        """
+        if self._executor is None or self._histogram_future is not None:
+            return
+
+        self.histogram_path = self.processed_dir / Path(HISTOGRAM_STEM)
+        original = self.original
+        histogram_path = self.histogram_path
+
+        def _build():
+            return build_histogram_file(
+                original.get_spatial(), histogram_path, HistogramType.FAST
+            )
+
+        self._histogram_future = self._executor.submit(_build)
+
+    def discard_histogram_build(self):
+        """
+        Discard the histogram built in background for a failed import: it is
+        cancelled if not started yet, otherwise its output is removed once
+        the build is over.
+        """
+        future = self._histogram_future
+        self._histogram_future = None
+        if future is None or future.cancel():
+            return
+
+        try:
+            future.result()
+        except Exception as e:  # noqa
+            log.debug(f"Discarded histogram build failed: {e}")
+        shutil.rmtree(self.histogram_path, ignore_errors=True)
+
     def deploy_histogram(self, image: Image) -> Histogram:
         """
         Deploy an histogram representation of the image so that it can be used for
-        efficient histogram requests.
+        efficient histogram requests. If the histogram is already being built
+        in background, wait for it.
         """
         self.histogram_path = self.processed_dir / Path(HISTOGRAM_STEM)
         self.notify(
@@ -371,9 +487,13 @@ class FileImporter:
             self.histogram_path, image
         )
         try:
-            self.histogram = build_histogram_file(
-                image, self.histogram_path, HistogramType.FAST
-            )
+            if self._histogram_future is not None:
+                self.histogram = self._histogram_future.result()
+                self._histogram_future = None
+            else:
+                self.histogram = build_histogram_file(
+                    image, self.histogram_path, HistogramType.FAST
+                )
         except (FileNotFoundError, FileExistsError) as e:
             self.notify(
                 ImportEventType.ERROR_HISTOGRAM, self.histogram_path, image,
@@ -399,9 +519,16 @@ class FileImporter:
         """Move origin to dest (with notifications)"""
         try:
             if prefer_copy:
-                shutil.copy(origin, dest)
+                # Uses zero-copy `sendfile` on Linux.
+                shutil.copyfile(origin, dest)
             else:
-                shutil.move(origin, dest)
+                try:
+                    # Single rename syscall when on the same filesystem
+                    os.replace(origin, dest)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(origin, dest)
         except (FileNotFoundError, FileExistsError, OSError) as e:
             self.notify(ImportEventType.FILE_NOT_MOVED, origin, exception=e)
             raise FileErrorProblem(origin)
@@ -461,7 +588,7 @@ class FileImporter:
                 func_from_str(BG_TASK_MAPPING.get(name))(*args_)
 
         if not get_settings().task_queue_enabled:
-            _sequential_imports()
+            BatchImporter().run(tasks)
         else:
             try:
                 task_group = group([
@@ -490,6 +617,139 @@ class FileImporter:
         return imported
 
 
+ImportTask = Tuple[Task, Sequence[Any]]
+
+
+class _ParentLogHandler(logging.Handler):
+    """
+    Handle a log record of a worker process with the logger of the same name
+    in the current process, so that it follows the application logging
+    configuration.
+    """
+    def emit(self, record: logging.LogRecord):
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def _lowest_log_level() -> int:
+    """The lowest log level enabled for a logger of the current process."""
+    levels = [
+        logger.level for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET
+    ]
+    return min(levels + [logging.getLogger().getEffectiveLevel()])
+
+
+def _init_worker(log_queue: multiprocessing.Queue, log_level: int):
+    """
+    Initialize a batch import worker process, once before its first import.
+    Formats are all imported (and thus initialized), and pyvips is
+    configured as in the application. Log records are sent to the parent
+    process through `log_queue`.
+    """
+    import pyvips
+    from pims.formats import FORMATS
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+
+    settings = get_settings()
+    pyvips.leak_set(settings.vips_allow_leak)
+    pyvips.cache_set_max(settings.vips_cache_max_items)
+    pyvips.cache_set_max_mem(settings.vips_cache_max_memory * 1048576)
+    pyvips.cache_set_max_files(settings.vips_cache_max_files)
+    log.debug(f"Import worker {os.getpid()} ready ({len(FORMATS)} formats)")
+
+
+def _run_one(task: ImportTask):
+    name, args = task
+    func_from_str(BG_TASK_MAPPING.get(name))(*args)
+
+
+def _run_in_worker(task: ImportTask):
+    name, args = task
+    try:
+        if name == Task.IMPORT_WITH_CYTOMINE:
+            # A worker process cannot use the connection of its parent process.
+            cytomine_auth = args[0]
+            with Cytomine(*cytomine_auth, configure_logging=False):
+                _run_one(task)
+        else:
+            _run_one(task)
+    except Exception as e:  # noqa
+        detail = getattr(e, 'detail', None) or str(e)
+        raise BatchImportError(type(e).__name__, str(detail)) from e
+
+
+class BatchImporter:
+    """
+    Importer for several independent files (such as the children of a
+    collection), run in parallel in worker processes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        max_workers
+            The maximum number of worker processes.
+            If not provided, the number of CPUs is used.
+            If 1, imports are run sequentially in the current process.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(self, tasks: List[ImportTask]):
+        """
+        Run import tasks, each one in its own `FileImporter`. An import error
+        does not stop other imports.
+
+        Parameters
+        ----------
+        tasks
+            Import tasks, as (task name, task arguments) pairs.
+
+        Raises
+        ------
+        Exception
+            The first error raised by an import, once all imports are over.
+            When imports are run in worker processes, it is a
+            `BatchImportError`.
+        """
+        errors = []
+        if len(tasks) <= 1 or self.max_workers == 1:
+            for task in tasks:
+                try:
+                    _run_one(task)
+                except Exception as e:  # noqa
+                    errors.append(e)
+        else:
+            # Workers are spawned, not forked: the current process can have
+            # running threads (event loop, thread pools, libvips) whose locks
+            # would be inherited in an inconsistent state by a forked child.
+            mp_context = multiprocessing.get_context('spawn')
+            log_queue = mp_context.Queue()
+            log_listener = QueueListener(log_queue, _ParentLogHandler())
+            log_listener.start()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(tasks)),
+                    mp_context=mp_context,
+                    initializer=_init_worker,
+                    initargs=(log_queue, _lowest_log_level())
+                ) as executor:
+                    futures = [
+                        executor.submit(_run_in_worker, task) for task in tasks
+                    ]
+            finally:
+                log_listener.stop()
+            errors = [f.exception() for f in futures if f.exception()]
+
+        if len(errors) > 0:
+            raise errors[0]
+
+
 def run_import(
     filepath: str, name: str, extra_listeners: Optional[List[ImportListener]] = None,
     prefer_copy: bool = False
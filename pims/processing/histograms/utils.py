@@ -18,7 +18,6 @@ from typing import Tuple
 
 import numpy as np
 import zarr as zarr
-from skimage.exposure import histogram
 
 from pims.api.utils.models import Colorspace, HistogramType
 from pims.api.utils.output_parameter import get_thumb_output_dimensions
@@ -53,6 +52,15 @@ def argmax_nonzero(arr, axis=-1):
     return arr.shape[axis] - np.argmax(np.flip(arr, axis=axis) != 0, axis=axis) - 1
 
 
+def dtype_histogram(channel: np.ndarray) -> np.ndarray:
+    """
+    Compute the histogram of an unsigned integer (uint8 or uint16) array,
+    with one bin per possible value of its dtype.
+    """
+    n_values = np.iinfo(channel.dtype).max + 1
+    return np.bincount(channel.ravel(), minlength=n_values)
+
+
 def clamp_histogram(hist, bounds=None) -> Tuple[np.ndarray, np.ndarray]:
     """
     Clamp a 1D histogram between bounds (inclusive). If bounds are not set,
@@ -183,7 +191,7 @@ def build_histogram_file(
     npplane_hist = np.zeros(shape=shape + (n_values,), dtype=np.uint64)
     for data, c_range, z, t, ratio in extract_fn(in_image):
         for read, c in enumerate(c_range):
-            h, _ = histogram(data[:, :, read], source_range='dtype')
+            h = dtype_histogram(data[:, :, read])
             npplane_hist[t, z, c, :] += np.rint(h * ratio).astype(np.uint64)
     zplane.array(ZHF_HIST, npplane_hist)
     zplane.array(
@@ -12,8 +12,28 @@
 #  * See the License for the specific language governing permissions and
 #  * limitations under the License.
 
+import itertools
+import os
 from uuid import uuid4
 
+_name_prefix = None
+_name_counter = None
+
+
+def _reset_unique_names():
+    """
+    Draw a new random prefix for this process. Called again in forked
+    children so that they do not generate the same names as their parent.
+    """
+    global _name_prefix, _name_counter
+    _name_prefix = uuid4().hex
+    _name_counter = itertools.count()
+
+
+_reset_unique_names()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_unique_names)
+
 
 def unique_name_generator():
-    return f"-{uuid4()}"
+    return f"-{_name_prefix}-{next(_name_counter)}"
@@ -46,6 +46,7 @@ REQUIRED = [
     'aiofiles>=0.7.0',
     'aioredis[hiredis]>=2.0.0',
     'celery>=5.0.0',
+    'libarchive-c>=5.0',
 
     'Pint>=0.17',
     'numpy>=1.20.1',
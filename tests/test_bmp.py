@@ -0,0 +1,112 @@
+#  * Copyright (c) 2020-2022. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+import struct
+
+import numpy as np
+import pytest
+from PIL import Image as PILImage
+
+from pims.files.file import Path
+from pims.formats.common.bmp import BMPFormat
+from pims.processing.region import Region
+
+
+def write_bmp(path, pixels, bpp=24, top_down=False, core_header=False):
+    """
+    Write RGB pixels (height, width, 3) as an uncompressed BMP, with a
+    Windows (BITMAPINFOHEADER) or OS/2 (BITMAPCOREHEADER) header.
+    """
+    height, width, _ = pixels.shape
+    pixel_size = bpp // 8
+    stride = ((width * bpp + 31) // 32) * 4
+
+    rows = np.zeros((height, stride), dtype=np.uint8)
+    bgrx = np.zeros((height, width, pixel_size), dtype=np.uint8)
+    bgrx[:, :, :3] = pixels[:, :, ::-1]
+    rows[:, :width * pixel_size] = bgrx.reshape((height, -1))
+    if not top_down:
+        rows = rows[::-1]
+
+    if core_header:
+        dib_header = struct.pack("<IHHHH", 12, width, height, 1, bpp)
+    else:
+        dib_header = struct.pack(
+            "<IiiHHIIiiII", 40, width, -height if top_down else height,
+            1, bpp, 0, rows.size, 2835, 2835, 0, 0
+        )
+    data_offset = 14 + len(dib_header)
+    file_header = struct.pack(
+        "<2sIHHI", b"BM", data_offset + rows.size, 0, 0, data_offset
+    )
+    with open(path, "wb") as f:
+        f.write(file_header + dib_header + rows.tobytes())
+
+
+def random_pixels(width, height, seed=0):
+    return np.random.RandomState(seed).randint(
+        0, 256, (height, width, 3), dtype=np.uint8
+    )
+
+
+@pytest.mark.parametrize("width, height", [(30, 20), (1401, 3), (5, 1500)])
+@pytest.mark.parametrize("top_down, core_header", [
+    (False, False), (True, False), (False, True)
+])
+def test_bmp_peek_dimensions(tmp_path, width, height, top_down, core_header):
+    path = Path(tmp_path / "image.bmp")
+    write_bmp(
+        path, random_pixels(width, height),
+        top_down=top_down, core_header=core_header
+    )
+
+    format = BMPFormat(path)
+    imd = format.main_imd
+    assert format._peek_dimensions() == (imd.width, imd.height)
+    assert format.need_conversion == (imd.width > 1400 or imd.height > 1400)
+
+
+@pytest.mark.parametrize("bpp", [24, 32])
+@pytest.mark.parametrize("top_down", [False, True])
+def test_bmp_read_window(tmp_path, bpp, top_down):
+    width, height = 37, 23
+    path = Path(tmp_path / "image.bmp")
+    write_bmp(path, random_pixels(width, height), bpp=bpp, top_down=top_down)
+    with PILImage.open(path) as image:
+        expected = np.asarray(image.convert("RGB"))
+
+    format = BMPFormat(path)
+    reader = format.reader
+    full = reader.read_window(Region(0, 0, width, height), width, height)
+    # Pixels are read from the memory map, not by Pillow
+    assert format.get_cached('_bmp_rgb_memmap', None) is not None
+    assert isinstance(full, PILImage.Image)
+    np.testing.assert_array_equal(np.asarray(full), expected)
+
+    window = reader.read_window(Region(5, 3, 20, 10), 20, 10)
+    assert isinstance(window, PILImage.Image)
+    np.testing.assert_array_equal(np.asarray(window), expected[5:15, 3:23])
+
+
+def test_bmp_read_window_palette(tmp_path):
+    # Not memory-mapped: read by Pillow
+    path = Path(tmp_path / "image.bmp")
+    PILImage.fromarray(random_pixels(16, 8)).convert("P").save(path, "BMP")
+    with PILImage.open(path) as image:
+        expected = np.asarray(image.convert("RGB"))
+
+    window = BMPFormat(path).reader.read_window(Region(2, 1, 10, 4), 10, 4)
+    assert isinstance(window, PILImage.Image)
+    np.testing.assert_array_equal(
+        np.asarray(window.convert("RGB")), expected[2:6, 1:11]
+    )
@@ -0,0 +1,148 @@
+#  * Copyright (c) 2020-2022. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+import io
+import stat
+import tarfile
+import zipfile
+
+import pytest
+
+from pims.files.archive import Archive
+from pims.files.file import Path
+
+
+def _add_tar_file(tar, name, content=b"data"):
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+def _add_tar_link(tar, name, target, type=tarfile.SYMTYPE):
+    info = tarfile.TarInfo(name)
+    info.type = type
+    info.linkname = target
+    tar.addfile(info)
+
+
+def _add_zip_symlink(zf, name, target):
+    info = zipfile.ZipInfo(name)
+    info.create_system = 3  # Unix
+    info.external_attr = (stat.S_IFLNK | 0o777) << 16
+    zf.writestr(info, target)
+
+
+def _list(directory):
+    return sorted(
+        str(p.relative_to(directory)) for p in Path(directory).rglob("*")
+    )
+
+
+@pytest.fixture
+def dest(tmp_path):
+    return Path(tmp_path / "dest" / "extracted")
+
+
+def test_extract_zip(tmp_path, dest):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("a.txt", b"a")
+        zf.writestr("sub/b.txt", b"b")
+        zf.writestr("__MACOSX/._a.txt", b"")
+
+    archive = Archive(path)
+    assert archive.format.name == "zip"
+    archive.extract(dest)
+    assert _list(dest) == ["a.txt", "sub", "sub/b.txt"]
+    assert (dest / "sub" / "b.txt").read_bytes() == b"b"
+
+
+@pytest.mark.parametrize("mode, name", [
+    ("w", "tar"), ("w:gz", "gztar"), ("w:bz2", "bztar"), ("w:xz", "xztar")
+])
+def test_extract_tar(tmp_path, dest, mode, name):
+    path = tmp_path / "archive"
+    with tarfile.open(path, mode, format=tarfile.USTAR_FORMAT) as tar:
+        _add_tar_file(tar, "a.txt", b"a")
+        _add_tar_file(tar, "sub/b.txt", b"b")
+
+    archive = Archive(path)
+    assert archive.format.name == name
+    archive.extract(dest)
+    assert _list(dest) == ["a.txt", "sub", "sub/b.txt"]
+    assert (dest / "a.txt").read_bytes() == b"a"
+
+
+def test_extract_dotdot(tmp_path, dest):
+    path = tmp_path / "archive.tar"
+    with tarfile.open(path, "w", format=tarfile.USTAR_FORMAT) as tar:
+        _add_tar_file(tar, "a.txt")
+        _add_tar_file(tar, "../evil.txt")
+        _add_tar_file(tar, "sub/../../evil2.txt")
+
+    Archive(path).extract(dest)
+    assert _list(dest) == ["a.txt"]
+    assert not (dest.parent / "evil.txt").exists()
+    assert not (dest.parent / "evil2.txt").exists()
+
+
+def test_extract_zip_dotdot(tmp_path, dest):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("a.txt", b"a")
+        zf.writestr("../evil.txt", b"evil")
+
+    Archive(path).extract(dest)
+    assert _list(dest) == ["a.txt"]
+    assert not (dest.parent / "evil.txt").exists()
+
+
+def test_extract_absolute_path(tmp_path, dest):
+    outside = tmp_path / "outside.txt"
+    path = tmp_path / "archive.tar"
+    with tarfile.open(path, "w", format=tarfile.GNU_FORMAT) as tar:
+        _add_tar_file(tar, "a.txt")
+        _add_tar_file(tar, str(outside))
+
+    Archive(path).extract(dest)
+    assert _list(dest) == ["a.txt"]
+    assert not outside.exists()
+
+
+def test_extract_tar_links(tmp_path, dest):
+    (tmp_path / "outside.txt").write_bytes(b"outside")
+    path = tmp_path / "archive.tar"
+    with tarfile.open(path, "w", format=tarfile.USTAR_FORMAT) as tar:
+        _add_tar_file(tar, "a.txt", b"a")
+        _add_tar_link(tar, "abs", "/")
+        _add_tar_link(tar, "loop", "..")
+        _add_tar_link(tar, "inner", "a.txt")
+        _add_tar_link(tar, "hard", "a.txt", tarfile.LNKTYPE)
+        _add_tar_link(tar, "hard-out", "../../outside.txt", tarfile.LNKTYPE)
+
+    Archive(path).extract(dest)
+    assert _list(dest) == ["a.txt", "hard"]
+    assert (dest / "hard").read_bytes() == b"a"
+    assert not (dest / "hard").is_symlink()
+
+
+def test_extract_zip_symlinks(tmp_path, dest):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("sub/a.txt", b"a")
+        _add_zip_symlink(zf, "link", "sub/a.txt")
+        _add_zip_symlink(zf, "evil", str(tmp_path))
+        _add_zip_symlink(zf, "loop", "..")
+
+    Archive(path).extract(dest)
+    assert _list(dest) == ["sub", "sub/a.txt"]
@@ -0,0 +1,51 @@
+#  * Copyright (c) 2020-2022. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+from PIL import Image as PILImage
+
+from pims.files.file import Path
+from pims.formats.common.webp import WebPChecker
+from pims.formats.utils.abstract import CachedDataPath
+from pims.formats.utils.checker import MagicNumberChecker
+
+
+class _FakeChecker(MagicNumberChecker):
+    MAGIC_NUMBERS = ((0, b"AB"), (4, b"CD"))
+
+
+def _cached_path(tmp_path, content):
+    path = Path(tmp_path / f"file{len(list(tmp_path.iterdir()))}")
+    path.write_bytes(content)
+    return CachedDataPath(path)
+
+
+def test_magic_number_checker(tmp_path):
+    assert _FakeChecker.match(_cached_path(tmp_path, b"AB..CD.."))
+    assert not _FakeChecker.match(_cached_path(tmp_path, b"AB..XD.."))
+    assert not _FakeChecker.match(_cached_path(tmp_path, b"XB..CD.."))
+    # Signature shorter than the last magic number
+    assert not _FakeChecker.match(_cached_path(tmp_path, b"AB..C"))
+
+
+def test_magic_number_checker_without_magic_number(tmp_path):
+    assert not MagicNumberChecker.match(_cached_path(tmp_path, b"AB..CD.."))
+
+
+def test_webp_checker(tmp_path):
+    path = Path(tmp_path / "image.webp")
+    PILImage.new("RGB", (8, 8)).save(path, "WEBP")
+    assert WebPChecker.match(CachedDataPath(path))
+
+    assert not WebPChecker.match(
+        _cached_path(tmp_path, b"RIFF\x00\x00\x00\x00WAVEfmt " + b"\x00" * 16)
+    )
@@ -0,0 +1,58 @@
+#  * Copyright (c) 2020-2022. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image as PILImage
+
+from pims.cache.memory import LRUCache
+from pims.files.file import Path
+from pims.formats.utils import factories
+from pims.formats.utils.factories import FormatFactory
+
+
+def _save(path, format):
+    PILImage.fromarray(np.zeros((8, 8, 3), dtype=np.uint8)).save(path, format)
+
+
+def test_match_modified_file_is_matched_again(tmp_path):
+    path = Path(tmp_path / "image")
+    _save(path, "PNG")
+    assert FormatFactory().match(path).get_identifier() == "PNG"
+    assert FormatFactory().match(path).get_identifier() == "PNG"
+
+    _save(path, "JPEG")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert FormatFactory().match(path).get_identifier() == "JPEG"
+
+
+def test_match_concurrently(tmp_path, monkeypatch):
+    # A tiny cache so that entries are evicted while other threads use it.
+    monkeypatch.setattr(factories, "_MATCH_CACHE", LRUCache(2))
+
+    paths = []
+    for i in range(16):
+        path = Path(tmp_path / f"image{i}")
+        _save(path, "PNG" if i % 2 else "JPEG")
+        paths.append(path)
+
+    def _match(path):
+        return FormatFactory().match(path).get_identifier()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        identifiers = list(executor.map(_match, paths * 20))
+
+    assert identifiers == ["PNG" if i % 2 else "JPEG" for i in range(16)] * 20
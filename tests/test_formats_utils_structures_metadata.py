@@ -77,6 +77,9 @@ def test_metadatastore():
     assert len(ms) == 3
     assert ms.get("test2.test.a") == Metadata("test.a", 3, "test2")
 
+    assert ms.get_values(("a", "test.a", "test.b")) == ("b", 2, None)
+    assert ms.get_values(("test.b",), default=0) == (0,)
+
     ms = MetadataStore()
     ms.set("test.a", 2)
     d = dict(TEST=dict(a=Metadata("a", 2, "test")))
@@ -0,0 +1,99 @@
+#  * Copyright (c) 2020-2022. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+import logging
+import uuid
+
+import pytest
+from PIL import Image as PILImage
+
+from pims.files.file import EXTRACTED_DIR
+from pims.importer import importer
+from pims.importer.importer import BatchImportError, BatchImporter, FILE_ROOT_PATH
+from pims.tasks.queue import Task
+
+
+def test_batch_importer_sequential_runs_all_imports(monkeypatch):
+    imported = []
+
+    def _import(filepath, name, prefer_copy):
+        imported.append(filepath)
+        if filepath.startswith("bad"):
+            raise ValueError(filepath)
+
+    monkeypatch.setattr(importer, "func_from_str", lambda _: _import)
+
+    tasks = [
+        (Task.IMPORT, [filepath, filepath, False])
+        for filepath in ("a", "bad1", "b", "bad2")
+    ]
+    with pytest.raises(ValueError, match="bad1"):
+        BatchImporter(max_workers=1).run(tasks)
+    assert imported == ["a", "bad1", "b", "bad2"]
+
+
+def test_batch_importer_empty():
+    BatchImporter().run([])
+
+
+def test_batch_importer_workers(tmp_path):
+    # Not in pending directory: each import fails in its worker process.
+    tasks = [
+        (Task.IMPORT, [str(tmp_path / f"image{i}.png"), f"image{i}.png", False])
+        for i in range(3)
+    ]
+    with pytest.raises(BatchImportError, match="FilepathNotFoundProblem"):
+        BatchImporter(max_workers=2).run(tasks)
+
+
+def test_batch_importer_workers_error_after_format_detection(tmp_path):
+    # The error raised for the truncated image refers to the (unpicklable)
+    # image: it must not break the worker pool and the other imports.
+    extracted_dir = tmp_path / EXTRACTED_DIR
+    extracted_dir.mkdir()
+    prefix = uuid.uuid4().hex
+    names = [f"{prefix}-{name}.png" for name in ("a", "truncated", "b")]
+    for name in names:
+        PILImage.new("RGB", (16, 16)).save(extracted_dir / name)
+    truncated = extracted_dir / names[1]
+    truncated.write_bytes(truncated.read_bytes()[:40])
+
+    FILE_ROOT_PATH.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        (Task.IMPORT, [str(extracted_dir / name), name, True])
+        for name in names
+    ]
+    with pytest.raises(BatchImportError, match="ImageParsingProblem"):
+        BatchImporter(max_workers=3).run(tasks)
+    for name in names:
+        # Each import went beyond format detection
+        upload_path, = FILE_ROOT_PATH.glob(f"*/{name}")
+        assert (upload_path.parent / "processed" / "original.PNG").exists()
+
+
+def test_batch_importer_workers_logs(tmp_path, caplog):
+    # Worker log records are handled by the loggers of the current process.
+    caplog.set_level(logging.INFO, logger="upload")
+    tasks = [
+        (Task.IMPORT, [str(tmp_path / f"image{i}.png"), f"image{i}.png", False])
+        for i in range(2)
+    ]
+    with pytest.raises(BatchImportError):
+        BatchImporter(max_workers=2).run(tasks)
+
+    for i in range(2):
+        messages = [
+            record.getMessage() for record in caplog.records
+            if record.name == f"upload.image{i}.png"
+        ]
+        assert f"Start import and data extraction for {tmp_path}/image{i}.png" in messages
@@ -10,6 +10,8 @@ from pims.files.file import (
     EXTRACTED_DIR, HISTOGRAM_STEM, ORIGINAL_STEM, PROCESSED_DIR, Path,
     SPATIAL_STEM, UPLOAD_DIR_PREFIX
 )
+from pims.formats.common.png import PNGChecker, PNGFormat
+from pims.formats.utils.abstract import CachedDataPath
 from pims.formats.utils.factories import FormatFactory
 from pims.api.utils.models import HistogramType
 from pims.processing.histograms.utils import build_histogram_file
@@ -120,3 +122,23 @@ def test_png_crop_null_annot(client, image_path_png):
 def test_png_histogram_perimage(client, image_path_png):
     _, filename = image_path_png
     histogram_perimage_test(client, filename, "png")
+
+def test_png_checker(tmp_path):
+    path = Path(tmp_path / "image.png")
+    Image.new("RGB", (8, 8)).save(path, "PNG")
+    assert PNGChecker.match(CachedDataPath(path))
+
+    # Only the first bytes of the PNG signature
+    truncated = Path(tmp_path / "truncated.png")
+    truncated.write_bytes(b"\x89PNG" + b"\x00" * 64)
+    assert not PNGChecker.match(CachedDataPath(truncated))
+
+@pytest.mark.parametrize("width, height", [(30, 20), (1025, 3), (5, 1100)])
+def test_png_peek_dimensions(tmp_path, width, height):
+    path = Path(tmp_path / "image.png")
+    Image.new("RGB", (width, height)).save(path, "PNG")
+
+    format = PNGFormat(path)
+    imd = format.main_imd
+    assert format._peek_dimensions() == (imd.width, imd.height)
+    assert format.need_conversion == (imd.width > 1024 or imd.height > 1024)
@@ -0,0 +1,34 @@
+#  * Copyright (c) 2020-2021. Authors: see NOTICE file.
+#  *
+#  * Licensed under the Apache License, Version 2.0 (the "License");
+#  * you may not use this file except in compliance with the License.
+#  * You may obtain a copy of the License at
+#  *
+#  *      http://www.apache.org/licenses/LICENSE-2.0
+#  *
+#  * Unless required by applicable law or agreed to in writing, software
+#  * distributed under the License is distributed on an "AS IS" BASIS,
+#  * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  * See the License for the specific language governing permissions and
+#  * limitations under the License.
+import numpy as np
+from numpy.testing import assert_array_equal
+from skimage.exposure import histogram
+
+from pims.processing.histograms.utils import dtype_histogram
+
+
+def test_dtype_histogram_uint8():
+    channel = np.random.randint(0, 256, size=(50, 40), dtype=np.uint8)
+    h = dtype_histogram(channel)
+    assert h.shape == (256,)
+    assert_array_equal(h, histogram(channel, source_range='dtype')[0])
+
+
+def test_dtype_histogram_uint16():
+    channel = np.random.randint(0, 4096, size=(50, 40), dtype=np.uint16)
+    h = dtype_histogram(channel)
+    assert h.shape == (65536,)
+    assert h.sum() == channel.size
+    assert_array_equal(h, histogram(channel, source_range='dtype')[0])
+